@@ -1,14 +1,59 @@
 import boto3
+import math
+import threading
+from boto3.dynamodb.conditions import Attr
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 
-dynamodb = boto3.resource('dynamodb')
-table = dynamodb.Table('DeploymentStatus')
+table_name = 'DeploymentStatus'
 
-response = table.scan()
-deployments = response['Items']
+# Table bytes per parallel Scan segment (one Scan page) and the upper bound on segments
+segment_bytes = 1024 * 1024
+max_segments = 8
 
-successful_deployments = [d for d in deployments if d['status'] == 'success']
-failed_deployments = [d for d in deployments if d['status'] == 'failure']
+# boto3 resources are not thread-safe, so each thread lazily creates its own table handle
+thread_local = threading.local()
 
-change_failure_rate = len(failed_deployments) / (len(successful_deployments) + len(failed_deployments))
+def get_table():
+    if not hasattr(thread_local, "table"):
+        thread_local.table = boto3.session.Session().resource('dynamodb').Table(table_name)
+    return thread_local.table
 
-print(f"Change Failure Rate: {change_failure_rate:.2%}")
+# Function to count deployment statuses in one Scan segment, following LastEvaluatedKey until it is exhausted
+def count_segment(segment=None):
+    # Only fetch the status attribute of finished deployments ('status' is a reserved word)
+    scan_kwargs = {
+        "FilterExpression": Attr('status').is_in(['success', 'failure']),
+        "ProjectionExpression": "#s",
+        "ExpressionAttributeNames": {"#s": "status"}
+    }
+    if segment is not None:
+        scan_kwargs.update({"Segment": segment, "TotalSegments": total_segments})
+
+    table = get_table()
+    status_counts = Counter()
+    while True:
+        response = table.scan(**scan_kwargs)
+        status_counts.update(d['status'] for d in response['Items'])
+        if 'LastEvaluatedKey' not in response:
+            return status_counts
+        scan_kwargs["ExclusiveStartKey"] = response['LastEvaluatedKey']
+
+# Only split the scan when the table spans several Scan pages
+table_size = get_table().meta.client.describe_table(TableName=table_name)['Table']['TableSizeBytes']
+total_segments = max(1, min(max_segments, math.ceil(table_size / segment_bytes)))
+
+if total_segments == 1:
+    status_counts = count_segment()
+else:
+    # Scan all segments concurrently and merge their counts
+    with ThreadPoolExecutor(max_workers=total_segments) as executor:
+        status_counts = sum(executor.map(count_segment, range(total_segments)), Counter())
+
+total_deployments = status_counts['success'] + status_counts['failure']
+
+if total_deployments:
+    change_failure_rate = status_counts['failure'] / total_deployments
+    print(f"Change Failure Rate: {change_failure_rate:.2%}")
+else:
+    print("Change Failure Rate: no finished deployments found")
@@ -1,14 +1,13 @@
 import boto3
 import datetime
-from dateutil.parser import parse
 
 # Configure your AWS profile and region
 aws_profile = "your_aws_profile_name"
 aws_region = "your_aws_region"
 
-# Set the date range for calculating Deployment Frequency
-start_date = datetime.datetime.now() - datetime.timedelta(days=30)
-end_date = datetime.datetime.now()
+# Set the date range for calculating Deployment Frequency (UTC, passed to lookup_events as StartTime/EndTime)
+end_date = datetime.datetime.now(datetime.timezone.utc)
+start_date = end_date - datetime.timedelta(days=30)
 
 # Initialize Boto3 CloudTrail client
 session = boto3.Session(profile_name=aws_profile, region_name=aws_region)
@@ -29,13 +28,10 @@ iterator = paginator.paginate(
     LookupAttributes=lookup_attributes
 )
 
-# Count the number of successful deployments
+# Count the number of successful deployments; CloudTrail already limits events to the StartTime/EndTime window
 deployment_count = 0
 for page in iterator:
-    for event in page["Events"]:
-        event_time = parse(event["EventTime"])
-        if start_date <= event_time <= end_date:
-            deployment_count += 1
+    deployment_count += len(page["Events"])
 
 # Calculate Deployment Frequency
 deployment_frequency = deployment_count
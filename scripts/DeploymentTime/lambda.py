@@ -1,12 +1,23 @@
 import boto3
 import json
+import logging
+import os
 from datetime import datetime
 
+logger = logging.getLogger()
+# Log level follows Lambda's log-level control, else LOG_LEVEL (e.g. DEBUG to dump received events);
+# names are case-insensitive, TRACE maps to DEBUG and unknown names fall back to INFO
+log_level = (os.environ.get("AWS_LAMBDA_LOG_LEVEL") or os.environ.get("LOG_LEVEL", "INFO")).upper()
+log_level = "DEBUG" if log_level == "TRACE" else log_level
+logger.setLevel(log_level if isinstance(logging.getLevelName(log_level), int) else logging.INFO)
+
 dynamodb = boto3.resource('dynamodb')
 table = dynamodb.Table('DeploymentTimeTable')
 
 def lambda_handler(event, context):
-    print("Received event: " + json.dumps(event, indent=2))
+    # Only serialize the event when debug logging is enabled
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Received event: %s", json.dumps(event, indent=2))
 
     service = event['detail']['service']
     task_definition_arn = event['detail']['taskDefinitionArn']
@@ -14,7 +25,7 @@ def lambda_handler(event, context):
     end_time = datetime.fromisoformat(event['detail']['completedAt'])
     deployment_time = (end_time - start_time).total_seconds()
 
-    response = table.put_item(
+    table.put_item(
         Item={
             'service': service,
             'task_definition_arn': task_definition_arn,
@@ -24,4 +35,4 @@ def lambda_handler(event, context):
         }
     )
 
-    print(f"Stored deployment information: {response}")
+    logger.info("Stored deployment time for %s: %.1fs", service, deployment_time)
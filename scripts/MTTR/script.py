@@ -1,6 +1,12 @@
 import requests
+from requests.adapters import HTTPAdapter
 from requests.auth import HTTPBasicAuth
+from urllib3.util.retry import Retry
 import datetime
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 
 # Set your JIRA API credentials and base URL
 jira_username = "your_jira_username"
@@ -13,15 +19,52 @@ jql_query = "project = YOUR_PROJECT_KEY AND issuetype = Bug AND status = Resolve
 # Set the date format used by JIRA
 jira_date_format = "%Y-%m-%dT%H:%M:%S.%f%z"
 
-# Function to get issues from JIRA using the REST API
-def get_jira_issues(jql):
+# Number of JIRA result pages fetched concurrently
+max_page_workers = 4
+
+# Retry transient JIRA failures and rate limiting with exponential backoff
+retry = Retry(total=5, backoff_factor=0.5, status_forcelist=(429, 500, 502, 503, 504), allowed_methods=frozenset(["GET"]))
+
+# requests.Session is not documented as thread-safe, so each thread lazily creates its own
+thread_local = threading.local()
+
+# Function to get this thread's HTTP session, reused across its JIRA requests
+def get_session():
+    if not hasattr(thread_local, "session"):
+        session = requests.Session()
+        session.auth = HTTPBasicAuth(jira_username, jira_password)
+        session.headers.update({"Accept": "application/json"})
+        session.mount("https://", HTTPAdapter(max_retries=retry))
+        thread_local.session = session
+    return thread_local.session
+
+# Function to fetch one page of JIRA search results
+def get_jira_page(jql, start_at):
     url = f"{jira_base_url}/rest/api/3/search"
-    headers = {"Accept": "application/json"}
-    params = {"jql": jql, "fields": "created, resolutiondate"}
+    params = {"jql": jql, "fields": "created, resolutiondate", "startAt": start_at, "maxResults": 100}
 
-    response = requests.get(url, headers=headers, params=params, auth=HTTPBasicAuth(jira_username, jira_password))
+    response = get_session().get(url, params=params, timeout=30)
     response.raise_for_status()
-    return response.json()["issues"]
+    return response.json()
+
+# Function to get issues from JIRA using the REST API, yielding them page by page
+def get_jira_issues(jql):
+    first_page = get_jira_page(jql, 0)
+    yield from first_page["issues"]
+
+    # The first page reports the total, so the remaining pages can be fetched concurrently
+    page_size = first_page["maxResults"]
+    if not first_page["issues"] or page_size <= 0:
+        return
+    start_ats = iter(range(page_size, first_page["total"], page_size))
+    with ThreadPoolExecutor(max_workers=max_page_workers) as executor:
+        # Keep at most max_page_workers pages in flight so memory stays bounded
+        pending = deque(executor.submit(get_jira_page, jql, start_at) for start_at in islice(start_ats, max_page_workers))
+        while pending:
+            page = pending.popleft().result()
+            for start_at in islice(start_ats, 1):
+                pending.append(executor.submit(get_jira_page, jql, start_at))
+            yield from page["issues"]
 
 # Function to calculate resolution time for a JIRA issue
 def calculate_resolution_time(issue):